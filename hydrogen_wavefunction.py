@@ -9,10 +9,70 @@
 # --- --- --- --- --- --- --- --- ---
 
 from scipy.constants import physical_constants
+from functools import lru_cache, partial
+from multiprocessing import Pool
+from matplotlib.colors import Normalize
+from matplotlib.cm import ScalarMappable
 import matplotlib.pyplot as plt
 import scipy.special as sp
 import seaborn as sns
 import numpy as np
+import math
+import os
+
+
+# z-x plane grid geometry, shared by all evaluations through the grid cache
+GRID_EXTENT = 480
+GRID_RESOLUTION = 680
+
+# Matplotlib rcParams shared by all plots
+PLOT_STYLE = {
+    'font.family': 'STIXGeneral',
+    'mathtext.fontset': 'stix',
+    'xtick.major.width': 4,
+    'ytick.major.width': 4,
+    'xtick.major.size': 15,
+    'ytick.major.size': 15,
+    'xtick.labelsize': 30,
+    'ytick.labelsize': 30,
+    'axes.linewidth': 4,
+}
+
+
+@lru_cache(maxsize=None)
+def laguerre_coefficients(n, l):
+    """ Compute the coefficients of the generalized Laguerre
+    polynomial used by the radial part of the wavefunction.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+    Returns:
+        numpy.ndarray: polynomial coefficients, highest degree first
+    """
+
+    coefficients = sp.genlaguerre(n - l - 1, 2 * l + 1).coef
+    coefficients.setflags(write=False)
+    return coefficients
+
+
+@lru_cache(maxsize=None)
+def radial_normalization(n, l, a0):
+    """ Compute the normalization constant of the radial part of the wavefunction.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        a0 (float): scaled Bohr radius
+    Returns:
+        float: radial normalization constant
+    """
+
+    log_norm = (
+        3 * math.log(2 / (n * a0)) + math.lgamma(n - l) -
+        math.log(2 * n) - math.lgamma(n + l + 1)
+    )
+    return math.exp(0.5 * log_norm)
 
 
 def radial_function(n, l, r, a0):
@@ -28,39 +88,145 @@ def radial_function(n, l, r, a0):
         numpy.ndarray: wavefunction radial component
     """
 
-    laguerre = sp.genlaguerre(n - l - 1, 2 * l + 1)
-    p = 2 * r / (n * a0)
+    laguerre = laguerre_coefficients(n, l)
+    p = r * (2 / (n * a0))
+
+    constant_factor = radial_normalization(n, l, a0)
+
+    # Accumulate the product in a single buffer to avoid grid-sized temporaries,
+    # applying p ** l as repeated multiplication rather than a generic pow()
+    # and folding the constant factor into the Laguerre coefficients
+    radial = np.exp(-0.5 * p)
+    for _ in range(l):
+        radial *= p
+    radial *= np.polyval(constant_factor * laguerre, p)
+    return radial
+
+
+def normalized_legendre(m, l, x):
+    """ Evaluate the associated Legendre function Plm(x) scaled by its
+    spherical harmonic normalization sqrt((2l+1)/(4π) (l-m)!/(l+m)!),
+    over a whole array, by ascending recurrence in the degree.
+
+    Args:
+        m (int): order, satisfying 0 <= m <= l
+        l (int): degree
+        x (numpy.ndarray): argument, within [-1, 1]
+    Returns:
+        numpy.ndarray: normalized associated Legendre function values, in the floating point type of x
+    """
 
-    constant_factor = np.sqrt(
-        ((2 / n * a0) ** 3 * (sp.factorial(n - l - 1))) /
-        (2 * n * (sp.factorial(n + l)))
+    # λmm(x) = (-1)^m sqrt((2m+1)/(4π) (2m)!/(4^m m!²)) (1-x²)^(m/2), kept in the floating point type of x
+    legendre = np.ones(np.shape(x), dtype=np.result_type(x, 1.0))
+    if m:
+        np.power(np.maximum(1 - np.square(x), 0), 0.5 * m, out=legendre)
+    log_norm = (
+        math.log(2 * m + 1) + math.lgamma(2 * m + 1) - math.log(4 * math.pi) -
+        m * math.log(4) - 2 * math.lgamma(m + 1)
     )
-    return constant_factor * np.exp(-p / 2) * (p ** l) * laguerre(p)
+    legendre *= (-1) ** m * math.exp(0.5 * log_norm)
+
+    # λkm(x) = a_k x λk-1,m(x) - b_k λk-2,m(x), whose values stay of order one
+    previous = np.zeros_like(legendre)
+    for k in range(m + 1, l + 1):
+        a_k = math.sqrt((4 * k * k - 1) / (k * k - m * m))
+        b_k = math.sqrt(max((2 * k + 1) * ((k - 1) ** 2 - m * m) / ((2 * k - 3) * (k * k - m * m)), 0))
+        previous *= -b_k
+        previous += a_k * x * legendre
+        legendre, previous = previous, legendre
+    return legendre
 
 
-def angular_function(m, l, theta, phi):
+def angular_function(m, l, cos_theta, phi):
     """ Compute the normalized angular part of the wavefunction using
-    Legendre polynomials and a phase-shifting exponential factor.
+    Legendre polynomials and a phase-shifting cosine factor.
 
     Args:
         m (int): magnetic quantum number
         l (int): azimuthal quantum number
-        theta (numpy.ndarray): polar angle
+        cos_theta (numpy.ndarray): cosine of the polar angle
         phi (int): azimuthal angle
     Returns:
         numpy.ndarray: wavefunction angular component
     """
 
-    legendre = sp.lpmv(m, l, np.cos(theta))
+    legendre = normalized_legendre(abs(m), l, cos_theta)
 
-    constant_factor = ((-1) ** m) * np.sqrt(
-        ((2 * l + 1) * sp.factorial(l - np.abs(m))) /
-        (4 * np.pi * sp.factorial(l + np.abs(m)))
-    )
-    return constant_factor * legendre * np.real(np.exp(1.j * m * phi))
+    # (-1)^m phase; for negative orders it cancels against Pl,-m(x) = (-1)^m (l-m)!/(l+m)! Plm(x)
+    constant_factor = (-1) ** max(m, 0)
+
+    # Re(e^(imφ)) = cos(mφ); combine the scalar factors first so a scalar phi
+    # scales the grid once, in place
+    if np.ndim(phi) == 0:
+        legendre *= constant_factor * math.cos(m * phi)
+        return legendre
+    return (constant_factor * np.cos(m * phi)) * legendre
+
+
+@lru_cache(maxsize=8)
+def z_x_plane_grid(grid_extent, grid_resolution):
+    """ Build the x >= 0, z >= 0 quadrant of the z-x plane grid along with
+    its polar coordinates, the rest of the grid following by symmetry.
+    The arrays only depend on the grid geometry, so they are cached
+    and shared (read-only) across wavefunction evaluations.
+
+    Args:
+        grid_extent (float): half-width of the grid
+        grid_resolution (int): number of grid points along each axis
+    Returns:
+        tuple: polar angle cosine, distinct radial coordinates and
+        the index mapping them back onto the quadrant
+    """
+
+    # Symmetrize the axis so the quadrant mirrors exactly onto the rest of the grid
+    axis = np.linspace(-grid_extent, grid_extent, grid_resolution)
+    axis = 0.5 * (axis - axis[::-1])
+    half_axis = axis[grid_resolution // 2:]
+
+    # x runs along rows and z along columns; broadcasting the two axes
+    # avoids materializing a meshgrid
+    x, z = half_axis[:, np.newaxis], half_axis[np.newaxis, :]
+    r = np.hypot(x, z)
 
+    # Work directly with cos(θ) = z / r, taking cos(θ) = 1 at the origin
+    cos_theta = np.divide(z, r, out=np.ones_like(r), where=r > 0)
 
-def compute_wavefunction(n, l, m, a0_scale_factor):
+    # The quadrant is symmetric under x <-> z, so radii repeat. Keep the distinct
+    # radii and the map back to the quadrant
+    radii, radii_index = np.unique(r, return_inverse=True)
+    radii_index = radii_index.reshape(r.shape)
+
+    for array in (cos_theta, radii, radii_index):
+        array.setflags(write=False)
+    return cos_theta, radii, radii_index
+
+
+def mirror_quadrant(quadrant, grid_resolution, negate_x=False, negate_z=False):
+    """ Assemble an array over the full z-x plane grid from its values
+    on the x >= 0, z >= 0 quadrant, by reflection across both axes.
+
+    Args:
+        quadrant (numpy.ndarray): values on the x >= 0, z >= 0 quadrant
+        grid_resolution (int): number of grid points along each axis
+        negate_x (bool): If True, the values change sign under x -> -x, defaults to False
+        negate_z (bool): If True, the values change sign under z -> -z, defaults to False
+    Returns:
+        numpy.ndarray: values on the full grid
+    """
+
+    half = grid_resolution // 2
+    full = np.empty((grid_resolution, grid_resolution), dtype=quadrant.dtype)
+    full[half:, half:] = quadrant
+    full[:half, half:] = quadrant[::-1][:half]
+    if negate_x:
+        np.negative(full[:half, half:], out=full[:half, half:])
+    full[:, :half] = full[:, ::-1][:, :half]
+    if negate_z:
+        np.negative(full[:, :half], out=full[:, :half])
+    return full
+
+
+def compute_wavefunction(n, l, m, a0_scale_factor, dtype=np.float64):
     """ Compute the normalized wavefunction as a product
     of its radial and angular components.
 
@@ -69,6 +235,7 @@ def compute_wavefunction(n, l, m, a0_scale_factor):
         l (int): azimuthal quantum number
         m (int): magnetic quantum number
         a0_scale_factor (float): Bohr radius scale factor
+        dtype (numpy.dtype): floating point type of the result, defaults to float64
     Returns:
         numpy.ndarray: wavefunction
     """
@@ -77,21 +244,16 @@ def compute_wavefunction(n, l, m, a0_scale_factor):
     a0 = a0_scale_factor * physical_constants['Bohr radius'][0] * 1e+12
 
     # z-x plane grid to represent electron spatial distribution
-    grid_extent = 480
-    grid_resolution = 680
-    z = x = np.linspace(-grid_extent, grid_extent, grid_resolution)
-    z, x = np.meshgrid(z, x)
-
-    # Use epsilon to avoid division by zero during angle calculations
-    eps = np.finfo(float).eps
-
-    # Ψnlm(r,θ,φ) = Rnl(r).Ylm(θ,φ)
-    psi = radial_function(
-        n, l, np.sqrt((x ** 2 + z ** 2)), a0
-    ) * angular_function(
-        m, l, np.arctan(x / (z + eps)), 0
-    )
-    return psi
+    cos_theta, radii, radii_index = z_x_plane_grid(GRID_EXTENT, GRID_RESOLUTION)
+
+    # Ψnlm(r,θ,φ) = Rnl(r).Ylm(θ,φ), evaluated on the x >= 0, z >= 0 quadrant
+    # Rnl(r) is evaluated once per distinct radius and gathered back onto the quadrant
+    psi = radial_function(n, l, radii, a0).astype(dtype)[radii_index]
+    psi *= angular_function(m, l, cos_theta.astype(dtype, copy=False), 0)
+
+    # On the z-x plane φ is 0 for x >= 0 and π for x < 0, so e^(imφ) flips the sign of Ψ
+    # under x -> -x for odd m, while Plm(-cos θ) = (-1)^(l+m) Plm(cos θ) under z -> -z
+    return mirror_quadrant(psi, GRID_RESOLUTION, negate_x=m % 2 == 1, negate_z=(l + m) % 2 == 1)
 
 
 def compute_probability_density(psi):
@@ -101,10 +263,126 @@ def compute_probability_density(psi):
     Returns:
         numpy.ndarray: wavefunction probability density
     """
-    return np.abs(psi) ** 2
 
+    # |ψ|² = Re(ψ)² + Im(ψ)², avoids the sqrt of np.abs followed by a square
+    prob_density = np.square(psi.real)
+    if np.iscomplexobj(psi):
+        prob_density += np.square(psi.imag)
+    return prob_density
+
+
+@lru_cache(maxsize=8)
+def radial_probability_density(n, l, a0_scale_factor, dtype=np.float64):
+    """ Compute |Rnl(r)|² on the distinct radii of the z-x plane grid.
+    It does not depend on m, so it is cached (read-only) and shared
+    by all the states (n,l,m) with the same n, l and scale factor.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        a0_scale_factor (float): Bohr radius scale factor
+        dtype (numpy.dtype): floating point type of the result, defaults to float64
+    Returns:
+        numpy.ndarray: radial probability density, indexed like the grid radii
+    """
+
+    a0 = a0_scale_factor * physical_constants['Bohr radius'][0] * 1e+12
+    _, radii, _ = z_x_plane_grid(GRID_EXTENT, GRID_RESOLUTION)
+
+    radial = np.square(radial_function(n, l, radii, a0)).astype(dtype)
+    radial.setflags(write=False)
+    return radial
+
+
+def compute_state_probability_density(n, l, m, a0_scale_factor, dtype=np.float64):
+    """ Compute the probability density of the wavefunction for a
+    given quantum state (n,l,m) without materializing the wavefunction.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        m (int): magnetic quantum number
+        a0_scale_factor (float): Bohr radius scale factor
+        dtype (numpy.dtype): floating point type of the result, defaults to float64
+    Returns:
+        numpy.ndarray: wavefunction probability density
+    """
+
+    # z-x plane grid to represent electron spatial distribution
+    cos_theta, _, radii_index = z_x_plane_grid(GRID_EXTENT, GRID_RESOLUTION)
+
+    # |Ψnlm|² = |Rnl(r)|².|Ylm(θ,φ)|², where the azimuthal phase drops out as |e^(imφ)|² = 1.
+    # Being even in both x and z, it is evaluated on a single quadrant and mirrored
+    quadrant = radial_probability_density(n, l, a0_scale_factor, dtype)[radii_index]
+    angular = angular_function(m, l, cos_theta.astype(dtype, copy=False), 0)
+    quadrant *= np.square(angular, out=angular)
+    return mirror_quadrant(quadrant, GRID_RESOLUTION)
+
+
+@lru_cache(maxsize=32)
+def colormap_palette(colormap):
+    """ Resolve a Seaborn colormap along with its darkest color,
+    which is used as the background of dark themed plots.
+
+    Args:
+        colormap (str): Seaborn plot colormap
+    Returns:
+        tuple: matplotlib colormap and its darkest color
+    """
+
+    cmap = sns.color_palette(colormap, as_cmap=True)
+    palette = np.asarray(sns.color_palette(colormap, n_colors=100))
+    luminance = palette @ np.array([0.2126, 0.7152, 0.0722])
+    darkest_color = tuple(palette[np.argmin(luminance)])
+    return cmap, darkest_color
+
+
+def downsample_to_display(array, display_size):
+    """ Block-average a square array holding more than twice as many
+    points per side as the display has pixels, since the extra points
+    cannot be resolved and only add to the rendering cost.
+
+    Args:
+        array (numpy.ndarray): square 2D array
+        display_size (int): display size in pixels
+    Returns:
+        tuple: the (possibly) downsampled array and the block size used
+    """
+
+    stride = array.shape[0] // (2 * display_size)
+    if stride < 2:
+        return array, 1
+    size = array.shape[0] // stride * stride
+    blocks = array[:size, :size].reshape(size // stride, stride, size // stride, stride)
+    return blocks.mean(axis=(1, 3)), stride
+
+
+@lru_cache(maxsize=8)
+def display_amplitude(n, l, m, a0_scale_factor, display_size):
+    """ Compute the square root of the probability density of a quantum
+    state (n,l,m), reduced to the resolution it is displayed at. The result
+    is cached (read-only), so plotting a state with both themes computes it once.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        m (int): magnetic quantum number
+        a0_scale_factor (float): Bohr radius scale factor
+        display_size (int): display size in pixels
+    Returns:
+        tuple: the amplitude and the block size used to downsample it
+    """
+
+    prob_density = compute_state_probability_density(n, l, m, a0_scale_factor, dtype=np.float32)
+    prob_density, stride = downsample_to_display(prob_density, display_size)
+
+    # Take the square root in place rather than allocating another grid-sized array
+    amplitude = np.sqrt(prob_density, out=prob_density)
+    amplitude.setflags(write=False)
+    return amplitude, stride
 
-def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colormap='rocket'):
+
+def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colormap='rocket', show=True):
     """ Plot the probability density of the hydrogen
     atom's wavefunction for a given quantum state (n,l,m).
 
@@ -115,6 +393,8 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
         a0_scale_factor (float): Bohr radius scale factor
         dark_theme (bool): If True, uses a dark background for the plot, defaults to False
         colormap (str): Seaborn plot colormap, defaults to 'rocket'
+        show (bool): If True, displays the plot after saving it, defaults to True. The figure is
+            closed afterwards, unless it is shown in interactive mode, where its window stays open
     """
 
     # Quantum numbers validation
@@ -127,46 +407,41 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
 
     # Colormap validation
     try:
-        sns.color_palette(colormap)
+        cmap, darkest_color = colormap_palette(colormap)
     except ValueError:
         raise ValueError(f'{colormap} is not a recognized Seaborn colormap.')
 
     # Configure plot aesthetics using matplotlib rcParams settings
-    plt.rcParams['font.family'] = 'STIXGeneral'
-    plt.rcParams['mathtext.fontset'] = 'stix'
-    plt.rcParams['xtick.major.width'] = 4
-    plt.rcParams['ytick.major.width'] = 4
-    plt.rcParams['xtick.major.size'] = 15
-    plt.rcParams['ytick.major.size'] = 15
-    plt.rcParams['xtick.labelsize'] = 30
-    plt.rcParams['ytick.labelsize'] = 30
-    plt.rcParams['axes.linewidth'] = 4
+    plt.rcParams.update(PLOT_STYLE)
 
     fig, ax = plt.subplots(figsize=(16, 16.5))
     plt.subplots_adjust(top=0.82)
     plt.subplots_adjust(right=0.905)
     plt.subplots_adjust(left=-0.1)
 
-    # Compute and visualize the wavefunction probability density
-    psi = compute_wavefunction(n, l, m, a0_scale_factor)
-    prob_density = compute_probability_density(psi)
-
-    # Here we transpose the array to align the calculated z-x plane with Matplotlib's y-x imshow display
-    im = ax.imshow(np.sqrt(prob_density).T, cmap=sns.color_palette(colormap, as_cmap=True))
+    # Compute and visualize the wavefunction probability density,
+    # keeping the original grid coordinates when it has been downsampled
+    display_size = int(max(ax.get_window_extent().size))
+    amplitude, stride = display_amplitude(n, l, m, a0_scale_factor, display_size)
+    grid_size = amplitude.shape[0] * stride
+    extent = (-0.5, grid_size - 0.5, grid_size - 0.5, -0.5)
+
+    # Here we transpose the array to align the calculated z-x plane with Matplotlib's y-x imshow display.
+    # The colormap is applied up front at the grid resolution, straight to 8-bit RGBA
+    norm = Normalize(vmin=amplitude.min(), vmax=amplitude.max())
+    ax.imshow(
+        cmap(norm(amplitude.T), bytes=True),
+        extent=extent, interpolation='nearest'
+    )
 
-    cbar = plt.colorbar(im, fraction=0.046, pad=0.03)
+    cbar = plt.colorbar(ScalarMappable(norm=norm, cmap=cmap), ax=ax, fraction=0.046, pad=0.03)
     cbar.set_ticks([])
 
     # Apply dark theme parameters
     if dark_theme:
         theme = 'dt'
-        background_color = sorted(
-            sns.color_palette(colormap, n_colors=100),
-            key=lambda color: 0.2126 * color[0] + 0.7152 * color[1] + 0.0722 * color[2]
-        )[0]
-        plt.rcParams['text.color'] = '#dfdfdf'
-        title_color = '#dfdfdf'
-        fig.patch.set_facecolor(background_color)
+        text_color = '#dfdfdf'
+        fig.patch.set_facecolor(darkest_color)
         cbar.outline.set_visible(False)
         ax.tick_params(axis='x', colors='#c4c4c4')
         ax.tick_params(axis='y', colors='#c4c4c4')
@@ -175,38 +450,57 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
 
     else:  # Apply light theme parameters
         theme = 'lt'
-        plt.rcParams['text.color'] = '#000000'
-        title_color = '#000000'
+        text_color = '#000000'
         ax.tick_params(axis='x', colors='#000000')
         ax.tick_params(axis='y', colors='#000000')
 
-    ax.set_title('Hydrogen Atom - Wavefunction Electron Density', pad=130, fontsize=44, loc='left', color=title_color)
+    ax.set_title('Hydrogen Atom - Wavefunction Electron Density', pad=130, fontsize=44, loc='left', color=text_color)
     ax.text(0, 722, (
         r'$|\psi_{n \ell m}(r, \theta, \varphi)|^{2} ='
         r' |R_{n\ell}(r) Y_{\ell}^{m}(\theta, \varphi)|^2$'
-    ), fontsize=36)
+    ), fontsize=36, color=text_color)
     ax.text(30, 615, r'$({0}, {1}, {2})$'.format(n, l, m), color='#dfdfdf', fontsize=42)
-    ax.text(770, 140, 'Electron probability distribution', rotation='vertical', fontsize=40)
-    ax.text(705, 700, 'Higher\nprobability', fontsize=24)
-    ax.text(705, -60, 'Lower\nprobability', fontsize=24)
-    ax.text(775, 590, '+', fontsize=34)
-    ax.text(769, 82, '−', fontsize=34, rotation='vertical')
+    ax.text(770, 140, 'Electron probability distribution', rotation='vertical', fontsize=40, color=text_color)
+    ax.text(705, 700, 'Higher\nprobability', fontsize=24, color=text_color)
+    ax.text(705, -60, 'Lower\nprobability', fontsize=24, color=text_color)
+    ax.text(775, 590, '+', fontsize=34, color=text_color)
+    ax.text(769, 82, '−', fontsize=34, rotation='vertical', color=text_color)
     ax.invert_yaxis()
 
-    # Save and display the plot
-    plt.savefig(f'({n},{l},{m})[{theme}].png')
-    plt.show()
+    # Save and display the plot, then close it to release its canvas, since plt.show()
+    # returns immediately without closing anything on non-interactive backends. In
+    # interactive mode plt.show() does not block either, so the window is left open there.
+    # Fast zlib compression saves about a fifth of the save time for somewhat larger files
+    fig.savefig(f'({n},{l},{m})[{theme}].png', pil_kwargs={'compress_level': 1})
+    if show:
+        plt.show()
+    if not show or not plt.isinteractive():
+        plt.close(fig)
 
 
 # - - - Example probability densities for various quantum states (n,l,m)
 if __name__ == '__main__':
 
-    plot_wf_probability_density(2, 1, 1, 0.6, True)
-    plot_wf_probability_density(2, 1, 1, 0.6)
-
-    plot_wf_probability_density(3, 2, 1, 0.3, True)
-    plot_wf_probability_density(3, 2, 1, 0.3)
-
-    plot_wf_probability_density(4, 3, 0, 0.2, dark_theme=True, colormap='magma')
-    plot_wf_probability_density(4, 3, 0, 0.2, colormap='magma')
-    plot_wf_probability_density(4, 3, 1, 0.2, dark_theme=True, colormap='mako')
+    examples = [
+        (2, 1, 1, 0.6, True),
+        (2, 1, 1, 0.6, False),
+
+        (3, 2, 1, 0.3, True),
+        (3, 2, 1, 0.3, False),
+
+        (4, 3, 0, 0.2, True, 'magma'),
+        (4, 3, 0, 0.2, False, 'magma'),
+        (4, 3, 1, 0.2, True, 'mako'),
+    ]
+
+    # Batch mode (HYDRO_BATCH=1) only saves the plots to file, using the Agg backend.
+    # The plots are independent, so they are spread over a pool of worker processes,
+    # in chunks of two so each light/dark pair shares its worker's cached amplitude
+    if os.environ.get('HYDRO_BATCH') == '1':
+        os.environ['MPLBACKEND'] = 'Agg'
+        plt.switch_backend('Agg')
+        with Pool() as pool:
+            pool.starmap(partial(plot_wf_probability_density, show=False), examples, chunksize=2)
+    else:
+        for example in examples:
+            plot_wf_probability_density(*example)
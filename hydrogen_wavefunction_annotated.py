@@ -9,10 +9,81 @@
 # --- --- --- --- --- --- --- --- ---
 
 from scipy.constants import physical_constants
+from functools import lru_cache, partial
+from multiprocessing import Pool
+from matplotlib.colors import Normalize
+from matplotlib.cm import ScalarMappable
 import matplotlib.pyplot as plt
 import scipy.special as sp
 import seaborn as sns
 import numpy as np
+import math
+import os
+
+
+# Geometry of the z-x plane grid on which every state is evaluated. Using the same
+# values everywhere lets all evaluations share a single cached grid
+GRID_EXTENT = 480
+GRID_RESOLUTION = 680
+
+# Matplotlib rcParams shared by all plots. The theme dependent colors are set on the
+# figure's own artists instead, leaving the global text color untouched
+PLOT_STYLE = {
+    'font.family': 'STIXGeneral',
+    'mathtext.fontset': 'stix',
+    'xtick.major.width': 4,
+    'ytick.major.width': 4,
+    'xtick.major.size': 15,
+    'ytick.major.size': 15,
+    'xtick.labelsize': 30,
+    'ytick.labelsize': 30,
+    'axes.linewidth': 4,
+}
+
+
+# Generalized Laguerre polynomial coefficients
+@lru_cache(maxsize=None)
+def laguerre_coefficients(n, l):
+    """ Compute the coefficients of the generalized Laguerre
+    polynomial used by the radial part of the wavefunction.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+    Returns:
+        numpy.ndarray: polynomial coefficients, highest degree first
+    """
+
+    # The polynomial only depends on the quantum numbers (n, l), so its coefficients are
+    # computed once and reused. Marking them read-only protects the cached array
+    coefficients = sp.genlaguerre(n - l - 1, 2 * l + 1).coef
+    coefficients.setflags(write=False)
+    return coefficients
+
+
+# Normalization constant of the radial function Rnl(r)
+@lru_cache(maxsize=None)
+def radial_normalization(n, l, a0):
+    """ Compute the normalization constant of the radial part of the wavefunction.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        a0 (float): scaled Bohr radius
+    Returns:
+        float: radial normalization constant
+    """
+
+    # The constant only depends on the quantum numbers and the Bohr radius,
+    # so it is cached rather than recomputing the factorials on every evaluation,
+    # e.g. when the same state is plotted with both the light and dark themes.
+    # The factorials are combined in log space through math.lgamma, working on plain
+    # Python floats and never overflowing, even though (n+l)! grows very quickly
+    log_norm = (
+        3 * math.log(2 / (n * a0)) + math.lgamma(n - l) -
+        math.log(2 * n) - math.lgamma(n + l + 1)
+    )
+    return math.exp(0.5 * log_norm)
 
 
 # Normalized radial function Rnl(r)
@@ -31,22 +102,19 @@ def radial_function(n, l, r, a0):
 
     # Laguerre polynomials describe how the electron density
     # changes as the distance from the nucleus increases
-    laguerre = sp.genlaguerre(n - l - 1, 2 * l + 1)
+    laguerre = laguerre_coefficients(n, l)
 
     # Normalized radial distance from the nucleus
-    p = 2 * r / (n * a0)
+    p = r * (2 / (n * a0))
 
     # This factor ensures the radial wavefunction is normalized
-    constant_factor = np.sqrt(
-        ((2 / n * a0) ** 3 * (sp.factorial(n - l - 1))) /
-        (2 * n * (sp.factorial(n + l)))
-    )
+    constant_factor = radial_normalization(n, l, a0)
 
     # The radial part of the wavefunction is constructed by the product of:
     # - Constant factor:
     #   Normalizes the radial wavefunction
 
-    # - Exponential decay factor: np.exp(-p / 2)
+    # - Exponential decay factor: np.exp(-0.5 * p)
     #   Reflects the decrease in probability of finding an
     #   electron as it moves away from the nucleus
 
@@ -54,53 +122,201 @@ def radial_function(n, l, r, a0):
     #   Introduces a dependency based on the azimuthal quantum number 'l',
     #   indicating different radial behaviors for different orbitals
 
-    # - Laguerre polynomial: laguerre(p)
+    # - Laguerre polynomial: np.polyval(laguerre, p)
     #   Captures oscillations in the electron density
-    #   as a function of radial distance
-    return constant_factor * np.exp(-p / 2) * (p ** l) * laguerre(p)
+    #   as a function of radial distance. The polynomial is evaluated from its
+    #   cached coefficients using Horner's method
+
+    # The product is accumulated in place in a single buffer, so evaluating it
+    # over the whole grid does not allocate one temporary array per factor.
+    # Since 'l' is a small integer, p ** l is applied as 'l' repeated
+    # multiplications rather than a generic power function per element.
+    # The constant factor is folded into the few Laguerre coefficients,
+    # which saves another multiplication over the whole array
+    radial = np.exp(-0.5 * p)
+    for _ in range(l):
+        radial *= p
+    radial *= np.polyval(constant_factor * laguerre, p)
+    return radial
+
+
+# Normalized associated Legendre functions λlm(x)
+def normalized_legendre(m, l, x):
+    """ Evaluate the associated Legendre function Plm(x) scaled by its
+    spherical harmonic normalization sqrt((2l+1)/(4π) (l-m)!/(l+m)!),
+    over a whole array, by ascending recurrence in the degree.
+
+    Args:
+        m (int): order, satisfying 0 <= m <= l
+        l (int): degree
+        x (numpy.ndarray): argument, within [-1, 1]
+    Returns:
+        numpy.ndarray: normalized associated Legendre function values, in the floating point type of x
+    """
+
+    # λmm(x) = (-1)^m sqrt((2m+1)/(4π) (2m)!/(4^m m!²)) (1-x²)^(m/2)
+    # The constant is computed in log space, as (2m)! alone overflows a float for large m
+    legendre = np.ones(np.shape(x), dtype=np.result_type(x, 1.0))
+    if m:
+        np.power(np.maximum(1 - np.square(x), 0), 0.5 * m, out=legendre)
+    log_norm = (
+        math.log(2 * m + 1) + math.lgamma(2 * m + 1) - math.log(4 * math.pi) -
+        m * math.log(4) - 2 * math.lgamma(m + 1)
+    )
+    legendre *= (-1) ** m * math.exp(0.5 * log_norm)
+
+    # λkm(x) = a_k x λk-1,m(x) - b_k λk-2,m(x)
+    # with a_k = sqrt((4k²-1)/(k²-m²)) and b_k = sqrt((2k+1)((k-1)²-m²)/((2k-3)(k²-m²)))
+    # Unlike the plain Plm(x), which grow like (2m-1)!! and overflow single
+    # precision from m ≈ 30, the normalized values stay of order one, so the
+    # recurrence is stable in float32 for any degree. The recurrence raises
+    # the degree one step at a time using whole-array operations, keeping
+    # only the two previous degrees and reusing their buffers in turn
+    previous = np.zeros_like(legendre)
+    for k in range(m + 1, l + 1):
+        a_k = math.sqrt((4 * k * k - 1) / (k * k - m * m))
+        b_k = math.sqrt(max((2 * k + 1) * ((k - 1) ** 2 - m * m) / ((2 * k - 3) * (k * k - m * m)), 0))
+        previous *= -b_k
+        previous += a_k * x * legendre
+        legendre, previous = previous, legendre
+    return legendre
 
 
 # Normalized angular function Ylm(θ,φ)
-def angular_function(m, l, theta, phi):
+def angular_function(m, l, cos_theta, phi):
     """ Compute the normalized angular part of the wavefunction using
-    Legendre polynomials and a phase-shifting exponential factor.
+    Legendre polynomials and a phase-shifting cosine factor.
 
     Args:
         m (int): magnetic quantum number
         l (int): azimuthal quantum number
-        theta (numpy.ndarray): polar angle
+        cos_theta (numpy.ndarray): cosine of the polar angle
         phi (int): azimuthal angle
     Returns:
         numpy.ndarray: wavefunction angular component
     """
 
     # Legendre polynomials describe the spatial arrangement and directional
-    # characteristics of electron probability densities
-    legendre = sp.lpmv(m, l, np.cos(theta))
+    # characteristics of electron probability densities. The normalization
+    # of the angular wavefunction is already folded into the recurrence
+    legendre = normalized_legendre(abs(m), l, cos_theta)
 
-    # This factor ensures that the angular wavefunction is normalized
-    constant_factor = ((-1) ** m) * np.sqrt(
-        ((2 * l + 1) * sp.factorial(l - np.abs(m))) /
-        (4 * np.pi * sp.factorial(l + np.abs(m)))
-    )
+    # The (-1)^m phase factor. For negative orders it cancels against the
+    # phase of Pl,-m(x) = (-1)^m (l-m)!/(l+m)! Plm(x), whose factorial ratio
+    # the normalization of Yl,-m(θ,φ) cancels in turn, so Yl,-m(θ,φ) reuses λl|m|(x)
+    constant_factor = (-1) ** max(m, 0)
 
     # The angular part of the wavefunction is constructed by the product of:
     # - Constant factor:
-    #   Normalizes the angular wavefunction
+    #   The (-1)^m phase
 
     # - Legendre polynomial:
     #   Describes the angular dependence of the wavefunction based on the quantum numbers.
     #   Providing insight into the orientation and shape of electron orbitals
     #   around the nucleus for given quantum numbers
 
-    # - Exponential factor: np.real(np.exp(1.j * m * phi))
+    # - Phase factor: np.cos(m * phi)
     #   Introduces a phase shift dependent on the magnetic quantum
-    #   number 'm' and the azimuthal angle 'phi'
-    return constant_factor * legendre * np.real(np.exp(1.j * m * phi))
+    #   number 'm' and the azimuthal angle 'phi'. Only the real part of
+    #   e^(imφ) is kept, which is cos(mφ), so no complex exponential is needed
+
+    # The scalar factors are combined first, so that for a scalar 'phi' the
+    # grid-sized Legendre array is scaled once, in place, without allocating a new array
+    if np.ndim(phi) == 0:
+        legendre *= constant_factor * math.cos(m * phi)
+        return legendre
+    return (constant_factor * np.cos(m * phi)) * legendre
+
+
+# Polar coordinates (r,cos θ) of the z-x plane grid
+@lru_cache(maxsize=8)
+def z_x_plane_grid(grid_extent, grid_resolution):
+    """ Build the x >= 0, z >= 0 quadrant of the z-x plane grid along with
+    its polar coordinates, the rest of the grid following by symmetry.
+    The arrays only depend on the grid geometry, so they are cached
+    and shared (read-only) across wavefunction evaluations.
+
+    Args:
+        grid_extent (float): half-width of the grid
+        grid_resolution (int): number of grid points along each axis
+    Returns:
+        tuple: polar angle cosine, distinct radial coordinates and
+        the index mapping them back onto the quadrant
+    """
+
+    # Establish a grid in the z-x plane, allowing the wavefunction to assign a probability
+    # value to each point. This grid aids in visualizing the electron's spatial distribution
+    axis = np.linspace(-grid_extent, grid_extent, grid_resolution)
+
+    # Floating point rounding makes linspace slightly asymmetric about zero. Averaging the
+    # axis with its mirror image makes it exactly symmetric, so that the x >= 0, z >= 0
+    # quadrant mirrors exactly onto the other three. Only that quadrant is built, as the
+    # wavefunction on the rest of the grid follows from its symmetries (see mirror_quadrant)
+    axis = 0.5 * (axis - axis[::-1])
+    half_axis = axis[grid_resolution // 2:]
+
+    # The x coordinate runs along the rows of the grid and z along its columns. Rather than
+    # expanding both into full 2D arrays with a meshgrid, the axes are kept as a column and a
+    # row, which NumPy broadcasts against each other
+    x, z = half_axis[:, np.newaxis], half_axis[np.newaxis, :]
+
+    # Distance from the nucleus of every grid point. np.hypot computes it in a single pass,
+    # without the intermediate squares of np.sqrt(x ** 2 + z ** 2)
+    r = np.hypot(x, z)
+
+    # The angular function only depends on the polar angle through cos(θ) = z / r, so we
+    # store that directly instead of computing θ with an inverse trigonometric function only
+    # for its cosine to be taken again. At the nucleus itself (r = 0) the polar angle is
+    # undefined, and cos(θ) = 1 is used to avoid a division by zero
+    cos_theta = np.divide(z, r, out=np.ones_like(r), where=r > 0)
+
+    # The quadrant is symmetric under swapping x and z, and other grid points also happen
+    # to share the same distance from the nucleus. Keeping only the distinct radii, along
+    # with the index that maps them back onto the quadrant, lets the radial function be
+    # evaluated on a fraction of the points
+    radii, radii_index = np.unique(r, return_inverse=True)
+    radii_index = radii_index.reshape(r.shape)
+
+    # The grid geometry does not depend on the quantum state, so the cached arrays
+    # are reused by every plot. Marking them read-only guards against accidental
+    # in-place modification by a caller
+    for array in (cos_theta, radii, radii_index):
+        array.setflags(write=False)
+    return cos_theta, radii, radii_index
+
+
+# Reflection of quadrant values onto the full z-x plane grid
+def mirror_quadrant(quadrant, grid_resolution, negate_x=False, negate_z=False):
+    """ Assemble an array over the full z-x plane grid from its values
+    on the x >= 0, z >= 0 quadrant, by reflection across both axes.
+
+    Args:
+        quadrant (numpy.ndarray): values on the x >= 0, z >= 0 quadrant
+        grid_resolution (int): number of grid points along each axis
+        negate_x (bool): If True, the values change sign under x -> -x, defaults to False
+        negate_z (bool): If True, the values change sign under z -> -z, defaults to False
+    Returns:
+        numpy.ndarray: values on the full grid
+    """
+
+    # The quadrant occupies the lower right corner of the grid. It is first mirrored across
+    # the z axis onto the x < 0 rows, and the resulting z >= 0 half is then mirrored across
+    # the x axis onto the z < 0 columns. Filling the grid this way only copies values,
+    # which is much cheaper than evaluating the wavefunction on the other three quadrants
+    half = grid_resolution // 2
+    full = np.empty((grid_resolution, grid_resolution), dtype=quadrant.dtype)
+    full[half:, half:] = quadrant
+    full[:half, half:] = quadrant[::-1][:half]
+    if negate_x:
+        np.negative(full[:half, half:], out=full[:half, half:])
+    full[:, :half] = full[:, ::-1][:, :half]
+    if negate_z:
+        np.negative(full[:, :half], out=full[:, :half])
+    return full
 
 
 # Normalized wavefunction Ψnlm(r,θ,φ) as a product of Rnl(r).Ylm(θ,φ)
-def compute_wavefunction(n, l, m, a0_scale_factor):
+def compute_wavefunction(n, l, m, a0_scale_factor, dtype=np.float64):
     """ Compute the normalized wavefunction as a product
     of its radial and angular components.
 
@@ -109,6 +325,7 @@ def compute_wavefunction(n, l, m, a0_scale_factor):
         l (int): azimuthal quantum number
         m (int): magnetic quantum number
         a0_scale_factor (float): Bohr radius scale factor
+        dtype (numpy.dtype): floating point type of the result, defaults to float64
     Returns:
         numpy.ndarray: wavefunction
     """
@@ -117,30 +334,30 @@ def compute_wavefunction(n, l, m, a0_scale_factor):
     # By scaling it, we adapt the wavefunction's spatial extent for effective visualization
     a0 = a0_scale_factor * physical_constants['Bohr radius'][0] * 1e+12
 
-    # Establish a grid in the z-x plane, allowing the wavefunction to assign a probability
-    # value to each point. This grid aids in visualizing the electron's spatial distribution
-    grid_extent = 480
-    grid_resolution = 680
-    z = x = np.linspace(-grid_extent, grid_extent, grid_resolution)
-    z, x = np.meshgrid(z, x)
-
-    # Using an epsilon value to prevent division by zero during the calculation of angles
-    eps = np.finfo(float).eps
+    # Retrieve the quadrant of the z-x plane grid on which the wavefunction is evaluated
+    cos_theta, radii, radii_index = z_x_plane_grid(GRID_EXTENT, GRID_RESOLUTION)
 
     # Compute the wavefunction by multiplying the radial and angular parts.
     # The radial part considers the distance from the nucleus, whereas the angular part
     # looks into the spatial orientation. Together, they define the electron's behavior
-    # in the atom's vicinity
-    psi = radial_function(
-        n, l, np.sqrt((x ** 2 + z ** 2)), a0
-    ) * angular_function(
-        m, l, np.arctan(x / (z + eps)), 0
-    )
-
+    # in the atom's vicinity. The radial part is evaluated once per distinct radius
+    # and then gathered back onto the quadrant, already converted to the requested
+    # floating point type, so that a float32 result never holds a float64 grid.
+    # The angular part is evaluated directly in that type as well, which halves the
+    # memory traffic of the Legendre recurrence for single precision results
+    psi = radial_function(n, l, radii, a0).astype(dtype)[radii_index]
+    psi *= angular_function(m, l, cos_theta.astype(dtype, copy=False), 0)
+
+    # The rest of the grid follows from the symmetries of the wavefunction:
+    # - In the z-x plane the azimuthal angle only takes two values: φ = 0 on the x >= 0 half
+    #   and φ = π on the x < 0 half. The phase factor e^(imφ) is therefore 1 or (-1)^m,
+    #   so the wavefunction changes sign under x -> -x for odd m
+    # - Under z -> -z, cos θ changes sign and Plm(-cos θ) = (-1)^(l+m) Plm(cos θ),
+    #   so the wavefunction changes sign for odd l+m
     # Return the computed wavefunction, which encapsulates the quantum state
     # of an electron in a hydrogen atom. The wavefunction contains complex amplitudes
     # that provide information about the quantum state's magnitude and phase
-    return psi
+    return mirror_quadrant(psi, GRID_RESOLUTION, negate_x=m % 2 == 1, negate_z=(l + m) % 2 == 1)
 
 
 # Probability density |Ψ|^2
@@ -155,11 +372,165 @@ def compute_probability_density(psi):
     # Return the computed probability density, which gives the likelihood of finding
     # the electron at a specific point in space for the given quantum state. The
     # values represent the square magnitude of the wavefunction, encapsulating the
-    # probability of the electron's presence in different regions of the atom
-    return np.abs(psi) ** 2
+    # probability of the electron's presence in different regions of the atom.
+    # It is computed as |ψ|² = Re(ψ)² + Im(ψ)², which skips the square root that
+    # np.abs would take only for the result to be squared again
+    prob_density = np.square(psi.real)
+    if np.iscomplexobj(psi):
+        prob_density += np.square(psi.imag)
+    return prob_density
+
+
+# Radial probability density |Rnl|^2 on the distinct radii of the grid
+@lru_cache(maxsize=8)
+def radial_probability_density(n, l, a0_scale_factor, dtype=np.float64):
+    """ Compute |Rnl(r)|² on the distinct radii of the z-x plane grid.
+    It does not depend on m, so it is cached (read-only) and shared
+    by all the states (n,l,m) with the same n, l and scale factor.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        a0_scale_factor (float): Bohr radius scale factor
+        dtype (numpy.dtype): floating point type of the result, defaults to float64
+    Returns:
+        numpy.ndarray: radial probability density, indexed like the grid radii
+    """
+
+    # The Bohr radius is scaled in the same way as for the wavefunction itself
+    a0 = a0_scale_factor * physical_constants['Bohr radius'][0] * 1e+12
+
+    # Only the distinct radii of the grid quadrant are needed here
+    _, radii, _ = z_x_plane_grid(GRID_EXTENT, GRID_RESOLUTION)
+
+    # The radial part is squared on the distinct radii, in double precision, and only then
+    # converted to the requested floating point type. The radial factor is about half of the
+    # cost of a density, so states differing only in m, such as the (4,3,0) and (4,3,1)
+    # examples, reuse it. The cached array is made read-only, as it is shared between callers
+    radial = np.square(radial_function(n, l, radii, a0)).astype(dtype)
+    radial.setflags(write=False)
+    return radial
+
+
+# Probability density |Ψnlm|^2 of a quantum state, computed from |Rnl|^2 and |Ylm|^2
+def compute_state_probability_density(n, l, m, a0_scale_factor, dtype=np.float64):
+    """ Compute the probability density of the wavefunction for a
+    given quantum state (n,l,m) without materializing the wavefunction.
+
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        m (int): magnetic quantum number
+        a0_scale_factor (float): Bohr radius scale factor
+        dtype (numpy.dtype): floating point type of the result, defaults to float64
+    Returns:
+        numpy.ndarray: wavefunction probability density
+    """
+
+    # Retrieve the quadrant of the z-x plane grid on which the probability density is evaluated
+    cos_theta, _, radii_index = z_x_plane_grid(GRID_EXTENT, GRID_RESOLUTION)
+
+    # Since |Ψnlm|² = |Rnl(r)|².|Ylm(θ,φ)|², both factors can be squared separately. The radial
+    # part comes squared on the distinct radii, before it is gathered onto the quadrant, and
+    # the azimuthal phase drops out entirely, as |e^(imφ)|² = 1. The angular factor is squared
+    # in place and multiplied straight into the density, so no extra temporaries are made.
+    # Like the wavefunction, the angular factor is evaluated in the requested floating point type
+    quadrant = radial_probability_density(n, l, a0_scale_factor, dtype)[radii_index]
+    angular = angular_function(m, l, cos_theta.astype(dtype, copy=False), 0)
+    quadrant *= np.square(angular, out=angular)
+
+    # Squaring removes the signs the wavefunction picks up under x -> -x and z -> -z,
+    # so the density is simply mirrored onto the other three quadrants
+    return mirror_quadrant(quadrant, GRID_RESOLUTION)
+
+
+# Colormap and dark theme background color lookup
+@lru_cache(maxsize=32)
+def colormap_palette(colormap):
+    """ Resolve a Seaborn colormap along with its darkest color,
+    which is used as the background of dark themed plots.
+
+    Args:
+        colormap (str): Seaborn plot colormap
+    Returns:
+        tuple: matplotlib colormap and its darkest color
+    """
+
+    # Both lookups only depend on the colormap name, so they are resolved
+    # once per colormap and reused by every subsequent plot
+    cmap = sns.color_palette(colormap, as_cmap=True)
+
+    # The darkest color is the palette entry with the lowest relative luminance,
+    # computed for all 100 entries at once as a matrix-vector product
+    palette = np.asarray(sns.color_palette(colormap, n_colors=100))
+    luminance = palette @ np.array([0.2126, 0.7152, 0.0722])
+    darkest_color = tuple(palette[np.argmin(luminance)])
+    return cmap, darkest_color
+
+
+# Downsampling of oversampled grids for display
+def downsample_to_display(array, display_size):
+    """ Block-average a square array holding more than twice as many
+    points per side as the display has pixels, since the extra points
+    cannot be resolved and only add to the rendering cost.
 
+    Args:
+        array (numpy.ndarray): square 2D array
+        display_size (int): display size in pixels
+    Returns:
+        tuple: the (possibly) downsampled array and the block size used
+    """
+
+    # Number of grid points averaged into each displayed point along each axis
+    stride = array.shape[0] // (2 * display_size)
+    if stride < 2:
+        return array, 1
+
+    # Trim the trailing rows and columns that do not fill a whole block,
+    # then average each stride x stride block into a single point
+    size = array.shape[0] // stride * stride
+    blocks = array[:size, :size].reshape(size // stride, stride, size // stride, stride)
+    return blocks.mean(axis=(1, 3)), stride
+
+
+# Displayed amplitude of a quantum state
+@lru_cache(maxsize=8)
+def display_amplitude(n, l, m, a0_scale_factor, display_size):
+    """ Compute the square root of the probability density of a quantum
+    state (n,l,m), reduced to the resolution it is displayed at.
 
-def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colormap='rocket'):
+    Args:
+        n (int): principal quantum number
+        l (int): azimuthal quantum number
+        m (int): magnetic quantum number
+        a0_scale_factor (float): Bohr radius scale factor
+        display_size (int): display size in pixels
+    Returns:
+        tuple: the (read-only) amplitude and the block size used to downsample it
+    """
+
+    # The density only ends up in an 8-bit colormap, so single precision is plenty, and it
+    # halves the memory traffic of every remaining pass over the grid
+    prob_density = compute_state_probability_density(n, l, m, a0_scale_factor, dtype=np.float32)
+
+    # When the grid holds far more points than the axes has pixels, the extra detail cannot be
+    # displayed anyway. Averaging it down beforehand reduces the work done by Matplotlib's image
+    # resampling
+    prob_density, stride = downsample_to_display(prob_density, display_size)
+
+    # By taking the square root of the probability density we reduce the dynamic range
+    # of the visualization, spreading out the values and making the electron's presence
+    # in low and medium probability regions more distinguishable. It is taken in place,
+    # so the displayed values reuse the density buffer instead of allocating a new array
+    amplitude = np.sqrt(prob_density, out=prob_density)
+
+    # The same state is typically plotted with both the light and dark themes. Caching the
+    # result means it is only computed once, and it is made read-only as it is shared
+    amplitude.setflags(write=False)
+    return amplitude, stride
+
+
+def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colormap='rocket', show=True):
     """ Plot the probability density of the hydrogen
     atom's wavefunction for a given quantum state (n,l,m).
 
@@ -170,6 +541,8 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
         a0_scale_factor (float): Bohr radius scale factor
         dark_theme (bool): If True, uses a dark background for the plot, defaults to False
         colormap (str): Seaborn plot colormap, defaults to 'rocket'
+        show (bool): If True, displays the plot after saving it, defaults to True. The figure is
+            closed afterwards, unless it is shown in interactive mode, where its window stays open
     """
 
     # Quantum numbers validation
@@ -182,20 +555,14 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
 
     # Colormap validation
     try:
-        sns.color_palette(colormap)
+        cmap, darkest_color = colormap_palette(colormap)
     except ValueError:
         raise ValueError(f'{colormap} is not a recognized Seaborn colormap.')
 
     # Configure plot aesthetics using matplotlib rcParams settings
-    plt.rcParams['font.family'] = 'STIXGeneral'
-    plt.rcParams['mathtext.fontset'] = 'stix'
-    plt.rcParams['xtick.major.width'] = 4
-    plt.rcParams['ytick.major.width'] = 4
-    plt.rcParams['xtick.major.size'] = 15
-    plt.rcParams['ytick.major.size'] = 15
-    plt.rcParams['xtick.labelsize'] = 30
-    plt.rcParams['ytick.labelsize'] = 30
-    plt.rcParams['axes.linewidth'] = 4
+    # They are applied on every call, so that plots keep their style even if the
+    # rcParams were reset in between, e.g. by plt.rcdefaults() or plt.rc_context()
+    plt.rcParams.update(PLOT_STYLE)
 
     # Create a new figure with specified dimensions
     fig, ax = plt.subplots(figsize=(16, 16.5))
@@ -203,30 +570,35 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
     plt.subplots_adjust(right=0.905)
     plt.subplots_adjust(left=-0.1)
 
-    # Compute and visualize the wavefunction probability density
-    # - By taking the square root of the probability density we reduce the dynamic range
-    #   of the visualization, spreading out the values and making the electron's presence
-    #   in low and medium probability regions more distinguishable
-    psi = compute_wavefunction(n, l, m, a0_scale_factor)
-    prob_density = compute_probability_density(psi)
-
-    # Here we transpose the array to align the calculated z-x plane with Matplotlib's y-x imshow display
-    im = ax.imshow(np.sqrt(prob_density).T, cmap=sns.color_palette(colormap, as_cmap=True))
+    # Compute the displayed amplitude of the wavefunction probability density, reduced to
+    # the resolution of the axes. The extent keeps the image in the original grid coordinates
+    # used for the labels, even when the grid has been averaged down
+    display_size = int(max(ax.get_window_extent().size))
+    amplitude, stride = display_amplitude(n, l, m, a0_scale_factor, display_size)
+    grid_size = amplitude.shape[0] * stride
+    extent = (-0.5, grid_size - 0.5, grid_size - 0.5, -0.5)
+
+    # Here we transpose the array to align the calculated z-x plane with Matplotlib's y-x imshow display.
+    # Nearest-neighbour interpolation maps grid points straight to pixels, skipping the
+    # antialiasing filter Matplotlib would otherwise run over the whole image.
+    # The colormap is applied up front, at the resolution of the grid, producing 8-bit RGBA
+    # values directly. Otherwise Matplotlib would first resample the data to the output size
+    # and only then normalize and colormap every output pixel through a float RGBA buffer
+    norm = Normalize(vmin=amplitude.min(), vmax=amplitude.max())
+    ax.imshow(
+        cmap(norm(amplitude.T), bytes=True),
+        extent=extent, interpolation='nearest'
+    )
 
-    # Add a colorbar
-    cbar = plt.colorbar(im, fraction=0.046, pad=0.03)
+    # Add a colorbar, which shares the normalization and colormap of the image
+    cbar = plt.colorbar(ScalarMappable(norm=norm, cmap=cmap), ax=ax, fraction=0.046, pad=0.03)
     cbar.set_ticks([])
 
     # Apply dark theme parameters
     if dark_theme:
         theme = 'dt'
-        background_color = sorted(
-            sns.color_palette(colormap, n_colors=100),
-            key=lambda color: 0.2126 * color[0] + 0.7152 * color[1] + 0.0722 * color[2]
-        )[0]
-        plt.rcParams['text.color'] = '#dfdfdf'
-        title_color = '#dfdfdf'
-        fig.patch.set_facecolor(background_color)
+        text_color = '#dfdfdf'
+        fig.patch.set_facecolor(darkest_color)
         cbar.outline.set_visible(False)
         ax.tick_params(axis='x', colors='#c4c4c4')
         ax.tick_params(axis='y', colors='#c4c4c4')
@@ -235,53 +607,81 @@ def plot_wf_probability_density(n, l, m, a0_scale_factor, dark_theme=False, colo
 
     else:  # Apply light theme parameters
         theme = 'lt'
-        plt.rcParams['text.color'] = '#000000'
-        title_color = '#000000'
+        text_color = '#000000'
         ax.tick_params(axis='x', colors='#000000')
         ax.tick_params(axis='y', colors='#000000')
 
-    ax.set_title('Hydrogen Atom - Wavefunction Electron Density', pad=130, fontsize=44, loc='left', color=title_color)
+    ax.set_title('Hydrogen Atom - Wavefunction Electron Density', pad=130, fontsize=44, loc='left', color=text_color)
     ax.text(0, 722, (
         r'$|\psi_{n \ell m}(r, \theta, \varphi)|^{2} ='
         r' |R_{n\ell}(r) Y_{\ell}^{m}(\theta, \varphi)|^2$'
-    ), fontsize=36)
+    ), fontsize=36, color=text_color)
     ax.text(30, 615, r'$({0}, {1}, {2})$'.format(n, l, m), color='#dfdfdf', fontsize=42)
-    ax.text(770, 140, 'Electron probability distribution', rotation='vertical', fontsize=40)
-    ax.text(705, 700, 'Higher\nprobability', fontsize=24)
-    ax.text(705, -60, 'Lower\nprobability', fontsize=24)
-    ax.text(775, 590, '+', fontsize=34)
-    ax.text(769, 82, '−', fontsize=34, rotation='vertical')
+    ax.text(770, 140, 'Electron probability distribution', rotation='vertical', fontsize=40, color=text_color)
+    ax.text(705, 700, 'Higher\nprobability', fontsize=24, color=text_color)
+    ax.text(705, -60, 'Lower\nprobability', fontsize=24, color=text_color)
+    ax.text(775, 590, '+', fontsize=34, color=text_color)
+    ax.text(769, 82, '−', fontsize=34, rotation='vertical', color=text_color)
     ax.invert_yaxis()
 
     # Save and display the plot
-    plt.savefig(f'({n},{l},{m})[{theme}].png')
-    plt.show()
+    # - When generating plots in batch, there is no need to display them
+    # - The figure is then closed, which releases its canvas instead of keeping every figure
+    #   in memory. On non-interactive backends such as Agg, plt.show() returns right away
+    #   without closing anything, so figures would otherwise pile up across plots
+    # - In interactive mode (plt.ion(), or IPython with a GUI backend) plt.show() does not block,
+    #   so a displayed figure is left open there, otherwise its window would vanish right away
+    # - PNG compression is a sizeable share of the save time. The fastest zlib level cuts it
+    #   by about a fifth, at the cost of files about 1.5x larger; the pixels are unchanged
+    fig.savefig(f'({n},{l},{m})[{theme}].png', pil_kwargs={'compress_level': 1})
+    if show:
+        plt.show()
+    if not show or not plt.isinteractive():
+        plt.close(fig)
 
 
 # - - - Example probability densities for various quantum states (n,l,m)
 if __name__ == '__main__':
 
-    plot_wf_probability_density(2, 1, 1, 0.6, True)
-    plot_wf_probability_density(2, 1, 1, 0.6)
-
-    plot_wf_probability_density(3, 2, 1, 0.3, True)
-    plot_wf_probability_density(3, 2, 1, 0.3)
-
-    plot_wf_probability_density(4, 3, 0, 0.2, dark_theme=True, colormap='magma')
-    plot_wf_probability_density(4, 3, 0, 0.2, colormap='magma')
-    plot_wf_probability_density(4, 3, 1, 0.2, dark_theme=True, colormap='mako')
-
-    # As we examine the electron density plots corresponding to the quantum numbers above, we notice
-    # that with increasing principal quantum number (n), the complexity of the wavefunction grows
-    # Specifically:
-    # - The number of nodes (regions where the probability density is zero) increases.
-    # - The electron's spatial distribution expands, covering larger regions around the nucleus.
-    # - The overall shape of the atomic orbital becomes more intricate and detailed.
-
-    plot_wf_probability_density(9, 6, 1, 0.04, True, colormap='mako')
-    plot_wf_probability_density(20, 10, 5, 0.01, True, colormap='mako')
-
-    # For extremely high quantum numbers, the following effects can be observed:
-    # - The complexity increases even further, resulting in numerous nodes and intricate patterns.
-    # - Evaluating the wavefunction over a vast spatial domain becomes computationally intensive.
-    # - Visualization can become cluttered, making it harder to discern specific details or features.
+    # Quantum numbers (n,l,m), Bohr radius scale factor, dark theme and colormap of each example
+    examples = [
+        (2, 1, 1, 0.6, True),
+        (2, 1, 1, 0.6, False),
+
+        (3, 2, 1, 0.3, True),
+        (3, 2, 1, 0.3, False),
+
+        (4, 3, 0, 0.2, True, 'magma'),
+        (4, 3, 0, 0.2, False, 'magma'),
+        (4, 3, 1, 0.2, True, 'mako'),
+
+        # As we examine the electron density plots corresponding to the quantum numbers above, we notice
+        # that with increasing principal quantum number (n), the complexity of the wavefunction grows
+        # Specifically:
+        # - The number of nodes (regions where the probability density is zero) increases.
+        # - The electron's spatial distribution expands, covering larger regions around the nucleus.
+        # - The overall shape of the atomic orbital becomes more intricate and detailed.
+
+        (9, 6, 1, 0.04, True, 'mako'),
+        (20, 10, 5, 0.01, True, 'mako'),
+
+        # For extremely high quantum numbers, the following effects can be observed:
+        # - The complexity increases even further, resulting in numerous nodes and intricate patterns.
+        # - Evaluating the wavefunction over a vast spatial domain becomes computationally intensive.
+        # - Visualization can become cluttered, making it harder to discern specific details or features.
+    ]
+
+    # In batch mode (HYDRO_BATCH=1) the plots are only saved to file. The non-interactive
+    # Agg backend is used, also in the worker processes, and each figure is closed once saved
+    # instead of being displayed. Since every plot is independent of the others, they are
+    # spread over a pool of worker processes, one per CPU core by default. The light and dark
+    # plots of a state are listed next to each other, and handing them out in chunks of two
+    # keeps each pair in the same worker, where the second plot reuses the cached amplitude
+    if os.environ.get('HYDRO_BATCH') == '1':
+        os.environ['MPLBACKEND'] = 'Agg'
+        plt.switch_backend('Agg')
+        with Pool() as pool:
+            pool.starmap(partial(plot_wf_probability_density, show=False), examples, chunksize=2)
+    else:
+        for example in examples:
+            plot_wf_probability_density(*example)